@@ -3,6 +3,7 @@ import re
 from typing import Optional, Union, Any, List, Dict
 import numpy as np
 import json
+import orjson
 from loguru import logger
 
 from ..message_handler import message_handler
@@ -126,7 +127,7 @@ async def handle_audio_output(
             display_text=display_text,
             actions=actions.to_dict() if actions else None,
         )
-        await websocket_send(json.dumps(audio_payload))
+        await websocket_send(orjson.dumps(audio_payload).decode())
     return full_response
 
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import json
+import orjson
 from ..agent.output_types import DisplayText, Actions
 from ..service_context import ServiceContext
 from .tts_manager import TTSTaskManager
@@ -15,30 +15,20 @@ async def speak_text(
     websocket_send,
     text: str,
 ) -> None:
-    display_text = DisplayText(
-        text=text,
-        name=context.character_config.character_name,
-        avatar=context.character_config.avatar,
-    )
+    display_text = DisplayText(text=text, **context.get_display_base())
 
     actions = None
+    tts_text = text
     if context.live2d_model:
-        try:
-            expr = context.live2d_model.extract_emotion(text)
-            if expr:
-                actions = Actions(expressions=expr)
-        except Exception:
-            pass
-
-    tts_text = (
-        context.live2d_model.remove_emotion_keywords(text)
-        if context.live2d_model
-        else text
-    )
+        tts_text, expr = context.live2d_model.split_emotions(text)
+        if expr:
+            actions = Actions(expressions=expr)
 
     tts_manager = TTSTaskManager()
 
-    await websocket_send(json.dumps({"type": "full-text", "text": display_text.text}))
+    await websocket_send(
+        orjson.dumps({"type": "full-text", "text": display_text.text}).decode()
+    )
     await send_conversation_start_signals(websocket_send)
 
     await tts_manager.speak(
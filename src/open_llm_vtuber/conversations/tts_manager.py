@@ -1,14 +1,12 @@
 import asyncio
-import json
+import orjson
 import re
-import uuid
-from datetime import datetime
 from typing import List, Optional, Dict
 from loguru import logger
 
 from ..agent.output_types import DisplayText, Actions
 from ..live2d_model import Live2dModel
-from ..tts.tts_interface import TTSInterface
+from ..tts.tts_interface import TTSInterface, new_cache_file_name_no_ext
 from ..utils.stream_audio import prepare_audio_payload
 from .types import WebSocketSend
 
@@ -47,6 +45,10 @@ class TTSTaskManager:
             tts_engine: TTS engine instance
             websocket_send: WebSocket send function
         """
+        # Serialize once; the payloads built for this sentence reuse the dicts
+        display_dict = display_text.to_dict()
+        actions_dict = actions.to_dict() if actions else None
+
         if len(re.sub(r'[\s.,!?，。！？\'"』」）】\s]+', "", tts_text)) == 0:
             logger.debug("Empty TTS text, sending silent display payload")
             # Get current sequence number for silent payload
@@ -59,7 +61,9 @@ class TTSTaskManager:
                     self._process_payload_queue(websocket_send)
                 )
 
-            await self._send_silent_payload(display_text, actions, current_sequence)
+            await self._send_silent_payload(
+                display_dict, actions_dict, current_sequence
+            )
             return
 
         logger.debug(
@@ -80,8 +84,8 @@ class TTSTaskManager:
         task = asyncio.create_task(
             self._process_tts(
                 tts_text=tts_text,
-                display_text=display_text,
-                actions=actions,
+                display_text=display_dict,
+                actions=actions_dict,
                 live2d_model=live2d_model,
                 tts_engine=tts_engine,
                 sequence_number=current_sequence,
@@ -105,7 +109,7 @@ class TTSTaskManager:
                 # Send payloads in order
                 while self._next_sequence_to_send in buffered_payloads:
                     next_payload = buffered_payloads.pop(self._next_sequence_to_send)
-                    await websocket_send(json.dumps(next_payload))
+                    await websocket_send(orjson.dumps(next_payload).decode())
                     self._next_sequence_to_send += 1
 
                 self._payload_queue.task_done()
@@ -115,8 +119,8 @@ class TTSTaskManager:
 
     async def _send_silent_payload(
         self,
-        display_text: DisplayText,
-        actions: Optional[Actions],
+        display_text: Dict,
+        actions: Optional[Dict],
         sequence_number: int,
     ) -> None:
         """Queue a silent audio payload"""
@@ -130,8 +134,8 @@ class TTSTaskManager:
     async def _process_tts(
         self,
         tts_text: str,
-        display_text: DisplayText,
-        actions: Optional[Actions],
+        display_text: Dict,
+        actions: Optional[Dict],
         live2d_model: Live2dModel,
         tts_engine: TTSInterface,
         sequence_number: int,
@@ -168,7 +172,7 @@ class TTSTaskManager:
         logger.debug(f"🏃Generating audio for '''{text}'''...")
         return await tts_engine.async_generate_audio(
             text=text,
-            file_name_no_ext=f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}",
+            file_name_no_ext=new_cache_file_name_no_ext(),
         )
 
     def clear(self) -> None:
@@ -1,3 +1,4 @@
+import re
 import json
 import chardet
 from loguru import logger
@@ -34,7 +35,7 @@ class Live2dModel:
 
     def set_model(self, model_name: str) -> None:
         """
-        Set the model with its name and load the model information. This method will initialize the `self.model_info`, `self.emo_map`, and `self.emo_str` attributes.
+        Set the model with its name and load the model information. This method will initialize the `self.model_info`, `self.emo_map`, and `self.emo_str` attributes, and the `self._emo_pattern` regex used by `split_emotions`.
         This method is called in the constructor.
 
         Parameters:
@@ -51,6 +52,15 @@ class Live2dModel:
         self.emo_str: str = " ".join([f"[{key}]," for key in self.emo_map.keys()])
         # emo_str is a string of the keys in the emoMap dictionary. The keys are enclosed in square brackets.
         # example: `"[fear], [anger], [disgust], [sadness], [joy], [neutral], [surprise]"`
+        # Matches any `[key]` tag from emo_map in one pass, used by split_emotions
+        emo_keys = sorted(self.emo_map, key=len, reverse=True)
+        self._emo_pattern: re.Pattern | None = (
+            re.compile(
+                r"\[(" + "|".join(map(re.escape, emo_keys)) + r")\]", re.IGNORECASE
+            )
+            if emo_keys
+            else None
+        )
 
     def _load_file_content(self, file_path: str) -> str:
         """Load the content of a file with robust encoding handling."""
@@ -192,3 +202,26 @@ class Live2dModel:
                 target_str = target_str[:start_index] + target_str[end_index:]
                 lower_str = lower_str[:start_index] + lower_str[end_index:]
         return target_str
+
+    def split_emotions(self, target_str: str) -> tuple[str, list]:
+        """
+        Remove the emotion keywords from the input string and collect their expression values in a single scan.
+
+        Parameters:
+            target_str (str): The string to check for emotions.
+
+        Returns:
+            tuple[str, list]: The cleaned string and the values of the emotions found, in order of appearance.
+        """
+
+        if self._emo_pattern is None:
+            return target_str, []
+
+        expression_list = []
+
+        def _collect(match: re.Match) -> str:
+            expression_list.append(self.emo_map[match.group(1).lower()])
+            return ""
+
+        cleaned_str = self._emo_pattern.sub(_collect, target_str)
+        return cleaned_str, expression_list
@@ -1,19 +1,73 @@
+import re
+import asyncio
 import os
-import json
+from typing import BinaryIO
 from uuid import uuid4
 import numpy as np
-from datetime import datetime
+import soundfile as sf
 from fastapi import APIRouter, WebSocket, UploadFile, File, Response, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from starlette.responses import JSONResponse
 from starlette.websockets import WebSocketDisconnect
 from loguru import logger
 from .service_context import ServiceContext
+from .asr.asr_interface import ASRInterface
+from .tts.tts_interface import new_cache_file_name_no_ext
 from .websocket_handler import WebSocketHandler
 from .conversations.direct_control import speak_text
 from .proxy_handler import ProxyHandler
 
 
+# A run of text up to and including its sentence-ending punctuation
+_SENTENCE_RE = re.compile(r"[^.!?。！？]+[.!?。！？]*")
+
+# Maximum number of /tts-ws sentences generated at the same time per request
+_TTS_WS_MAX_CONCURRENCY = 4
+
+
+def _decode_wav_upload(upload: BinaryIO) -> np.ndarray:
+    """
+    Decode an uploaded WAV file into mono float32 samples in [-1, 1).
+
+    Args:
+        upload: File object holding the complete uploaded file.
+
+    Returns:
+        np.ndarray: The decoded samples.
+
+    Raises:
+        ValueError: If the file cannot be decoded or contains no audio.
+    """
+    # Decode the WAV container, whatever chunks its header carries
+    try:
+        audio_int16, sample_rate = sf.read(upload, dtype="int16", always_2d=False)
+    except RuntimeError as e:
+        raise ValueError(
+            f"Audio format error: {str(e)}. Please ensure the file is 16-bit PCM WAV format."
+        )
+
+    # Validate audio data
+    if audio_int16.size == 0:
+        raise ValueError("Empty audio data")
+
+    if sample_rate != ASRInterface.SAMPLE_RATE:
+        logger.warning(
+            f"Uploaded audio is {sample_rate} Hz, ASR expects {ASRInterface.SAMPLE_RATE} Hz"
+        )
+
+    # Convert 16-bit PCM samples to float32 in a single cast-and-scale pass
+    audio_array = np.empty(audio_int16.shape, dtype=np.float32)
+    np.multiply(
+        audio_int16,
+        np.float32(1.0 / 32768.0),
+        out=audio_array,
+        dtype=np.float32,
+    )
+    if audio_array.ndim > 1:
+        audio_array = audio_array.mean(axis=1, dtype=np.float32)
+    return audio_array
+
+
 def init_client_ws_route(ws_handler: WebSocketHandler) -> APIRouter:
     """
     Create and return API routes for handling the `/client-ws` WebSocket connections.
@@ -25,7 +79,7 @@ def init_client_ws_route(ws_handler: WebSocketHandler) -> APIRouter:
         APIRouter: Configured router with WebSocket endpoint.
     """
 
-    router = APIRouter()
+    router = APIRouter(default_response_class=ORJSONResponse)
 
     @router.websocket("/client-ws")
     async def websocket_endpoint(websocket: WebSocket):
@@ -56,7 +110,7 @@ def init_proxy_route(server_url: str) -> APIRouter:
     Returns:
         APIRouter: Configured router with proxy WebSocket endpoint
     """
-    router = APIRouter()
+    router = APIRouter(default_response_class=ORJSONResponse)
     proxy_handler = ProxyHandler(server_url)
 
     @router.websocket("/proxy-ws")
@@ -82,7 +136,7 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
         APIRouter: Configured router with WebSocket endpoint.
     """
 
-    router = APIRouter()
+    router = APIRouter(default_response_class=ORJSONResponse)
 
     @router.get("/web-tool")
     async def web_tool_redirect():
@@ -94,50 +148,68 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
         """Redirect /web_tool to /web_tool/index.html"""
         return Response(status_code=302, headers={"Location": "/web-tool/index.html"})
 
+    # Last /live2d-models/info payload and the directory state it was built from
+    live2d_info_cache: dict = {"signature": None, "payload": None}
+
     @router.get("/live2d-models/info")
     async def get_live2d_folder_info():
         """Get information about available Live2D models"""
         live2d_dir = "live2d-models"
         if not os.path.exists(live2d_dir):
-            return JSONResponse(
+            return ORJSONResponse(
                 {"error": "Live2D models directory not found"}, status_code=404
             )
 
+        model_dirs = [entry for entry in os.scandir(live2d_dir) if entry.is_dir()]
+
+        # Adding or removing a model folder changes the mtime of live2d_dir,
+        # while copying files into an existing folder only changes that folder's
+        signature = (
+            os.stat(live2d_dir).st_mtime_ns,
+            tuple((entry.name, entry.stat().st_mtime_ns) for entry in model_dirs),
+        )
+        if signature == live2d_info_cache["signature"]:
+            return ORJSONResponse(live2d_info_cache["payload"])
+
         valid_characters = []
         supported_extensions = [".png", ".jpg", ".jpeg"]
 
-        for entry in os.scandir(live2d_dir):
-            if entry.is_dir():
-                folder_name = entry.name.replace("\\", "/")
+        for entry in model_dirs:
+            folder_name = entry.name.replace("\\", "/")
+            file_names = {
+                file.name for file in os.scandir(entry.path) if file.is_file()
+            }
+
+            if f"{folder_name}.model3.json" in file_names:
                 model3_file = os.path.join(
                     live2d_dir, folder_name, f"{folder_name}.model3.json"
                 ).replace("\\", "/")
 
-                if os.path.isfile(model3_file):
-                    # Find avatar file if it exists
-                    avatar_file = None
-                    for ext in supported_extensions:
-                        avatar_path = os.path.join(
+                # Find avatar file if it exists
+                avatar_file = None
+                for ext in supported_extensions:
+                    if f"{folder_name}{ext}" in file_names:
+                        avatar_file = os.path.join(
                             live2d_dir, folder_name, f"{folder_name}{ext}"
-                        )
-                        if os.path.isfile(avatar_path):
-                            avatar_file = avatar_path.replace("\\", "/")
-                            break
-
-                    valid_characters.append(
-                        {
-                            "name": folder_name,
-                            "avatar": avatar_file,
-                            "model_path": model3_file,
-                        }
-                    )
-        return JSONResponse(
-            {
-                "type": "live2d-models/info",
-                "count": len(valid_characters),
-                "characters": valid_characters,
-            }
-        )
+                        ).replace("\\", "/")
+                        break
+
+                valid_characters.append(
+                    {
+                        "name": folder_name,
+                        "avatar": avatar_file,
+                        "model_path": model3_file,
+                    }
+                )
+
+        payload = {
+            "type": "live2d-models/info",
+            "count": len(valid_characters),
+            "characters": valid_characters,
+        }
+        live2d_info_cache["signature"] = signature
+        live2d_info_cache["payload"] = payload
+        return ORJSONResponse(payload)
 
     @router.post("/asr")
     async def transcribe_audio(file: UploadFile = File(...)):
@@ -147,34 +219,10 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
         logger.info(f"Received audio file for transcription: {file.filename}")
 
         try:
-            contents = await file.read()
-
-            # Validate minimum file size
-            if len(contents) < 44:  # Minimum WAV header size
-                raise ValueError("Invalid WAV file: File too small")
-
-            # Decode the WAV header and get actual audio data
-            wav_header_size = 44  # Standard WAV header size
-            audio_data = contents[wav_header_size:]
-
-            # Validate audio data size
-            if len(audio_data) % 2 != 0:
-                raise ValueError("Invalid audio data: Buffer size must be even")
-
-            # Convert to 16-bit PCM samples to float32
-            try:
-                audio_array = (
-                    np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
-                    / 32768.0
-                )
-            except ValueError as e:
-                raise ValueError(
-                    f"Audio format error: {str(e)}. Please ensure the file is 16-bit PCM WAV format."
-                )
-
-            # Validate audio data
-            if len(audio_array) == 0:
-                raise ValueError("Empty audio data")
+            # The upload is already buffered by Starlette; decode it in place and
+            # keep the CPU-bound work off the event loop
+            await file.seek(0)
+            audio_array = await asyncio.to_thread(_decode_wav_upload, file.file)
 
             text = await default_context_cache.asr_engine.async_transcribe_np(
                 audio_array
@@ -184,19 +232,12 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
 
         except ValueError as e:
             logger.error(f"Audio format error: {e}")
-            return Response(
-                content=json.dumps({"error": str(e)}),
-                status_code=400,
-                media_type="application/json",
-            )
+            return ORJSONResponse({"error": str(e)}, status_code=400)
         except Exception as e:
             logger.error(f"Error during transcription: {e}")
-            return Response(
-                content=json.dumps(
-                    {"error": "Internal server error during transcription"}
-                ),
+            return ORJSONResponse(
+                {"error": "Internal server error during transcription"},
                 status_code=500,
-                media_type="application/json",
             )
 
     @router.websocket("/tts-ws")
@@ -214,19 +255,33 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
 
                 logger.info(f"Received text for TTS: {text}")
 
-                # Split text into sentences
-                sentences = [s.strip() for s in text.split(".") if s.strip()]
+                # Split text into sentences, keeping their end punctuation
+                sentences = [
+                    sentence
+                    for match in _SENTENCE_RE.finditer(text)
+                    if (sentence := match.group().strip())
+                ]
+
+                # Schedule every sentence up front so the engine can work ahead
+                # while earlier results are still being sent, a few at a time
+                tts_engine = default_context_cache.tts_engine
+                semaphore = asyncio.Semaphore(_TTS_WS_MAX_CONCURRENCY)
+
+                async def generate(sentence: str) -> str:
+                    async with semaphore:
+                        return await tts_engine.async_generate_audio(
+                            text=sentence,
+                            file_name_no_ext=new_cache_file_name_no_ext(),
+                        )
+
+                tasks = [
+                    asyncio.create_task(generate(sentence)) for sentence in sentences
+                ]
 
                 try:
-                    # Generate and send audio for each sentence
-                    for sentence in sentences:
-                        sentence = sentence + "."  # Add back the period
-                        file_name = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid4())[:8]}"
-                        audio_path = (
-                            await default_context_cache.tts_engine.async_generate_audio(
-                                text=sentence, file_name_no_ext=file_name
-                            )
-                        )
+                    # Send audio for each sentence in order
+                    for sentence, task in zip(sentences, tasks):
+                        audio_path = await task
                         logger.info(
                             f"Generated audio for sentence: {sentence} at: {audio_path}"
                         )
@@ -246,6 +301,14 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
                     logger.error(f"Error generating TTS: {e}")
                     await websocket.send_json({"status": "error", "message": str(e)})
 
+                finally:
+                    # Drop sentences that have not started yet. Ones already running
+                    # in a worker thread still finish, but their results are unused
+                    for task in tasks:
+                        task.cancel()
+                    # Retrieve every outcome so failed tasks are not reported later
+                    await asyncio.gather(*tasks, return_exceptions=True)
+
         except WebSocketDisconnect:
             logger.info("TTS WebSocket client disconnected")
         except Exception as e:
@@ -260,7 +323,7 @@ def init_direct_control_routes(
 ) -> APIRouter:
     """REST API for direct control over the active chat session."""
 
-    router = APIRouter()
+    router = APIRouter(default_response_class=ORJSONResponse)
 
     class CommonTarget(BaseModel):
         client_uid: str | None = Field(
@@ -280,22 +343,21 @@ def init_direct_control_routes(
 
     @router.get(
         "/v1/sessions",
-        response_model=list[str],
         summary="List connected session UIDs",
+        response_description="JSON array of connected client UIDs",
         tags=["sessions"],
     )
     async def list_sessions():
+        # Already a list of str, so skip response_model validation and encoding
         handler = ws_handler
-        if not handler:
-            return []
-        return list(handler.client_connections.keys())
+        return ORJSONResponse(list(handler.client_connections) if handler else [])
 
     def _resolve_targets(handler: WebSocketHandler, req: CommonTarget) -> list[str]:
         if not handler or not handler.client_connections:
             raise HTTPException(status_code=409, detail="No active chat session")
 
         if req.apply_to_all:
-            return list(handler.client_connections.keys())
+            return list(handler.client_connections)
 
         if req.client_uid:
             if req.client_uid not in handler.client_connections:
@@ -307,8 +369,32 @@ def init_direct_control_routes(
         if last_active and last_active in handler.client_connections:
             return [last_active]
 
-        keys = list(handler.client_connections.keys())
-        return [keys[-1]]
+        return [next(reversed(handler.client_connections))]
+
+    def _collect_delivered(
+        targets: list[str], results: list, action: str
+    ) -> tuple[list[str], list[str]]:
+        """
+        Split gathered per-target results into delivered and failed uids.
+
+        Raises:
+            HTTPException: 500 if any target failed and none succeeded.
+        """
+        delivered: list[str] = []
+        failed: list[str] = []
+        for uid, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to {action} for client {uid}: {result}")
+                failed.append(uid)
+            elif result:
+                delivered.append(uid)
+
+        if failed and not delivered:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to {action} for: {', '.join(failed)}",
+            )
+        return delivered, failed
 
     def _sync_memory(context) -> None:
         if not context or not context.history_uid:
@@ -331,25 +417,31 @@ def init_direct_control_routes(
         handler = ws_handler
         targets = _resolve_targets(handler, req)
 
-        delivered: list[str] = []
-        for uid in targets:
+        async def _speak_one(uid: str) -> bool:
             websocket = handler.client_connections.get(uid)
             if not websocket:
-                continue
+                return False
 
             context = handler.client_contexts.get(uid)
             if not context:
-                continue
+                return False
 
-            async def ws_send(payload: str):
-                await websocket.send_text(payload)
-            await speak_text(
-                context,
-                ws_send,
-                req.text,
-            )
-            delivered.append(uid)
+            # send_text is already a bound coroutine function for this websocket
+            await speak_text(context, websocket.send_text, req.text)
+            return True
 
+        # Speak to all targets concurrently instead of one client after another
+        results = await asyncio.gather(
+            *(_speak_one(uid) for uid in targets), return_exceptions=True
+        )
+        delivered, failed = _collect_delivered(targets, results, "speak")
+
+        if failed:
+            return SpeakResponse(
+                status="partial",
+                targets=delivered,
+                message=f"Speech failed for: {', '.join(failed)}",
+            )
         return SpeakResponse(status="ok", targets=delivered, message="Speech delivered")
 
     class SystemRequest(CommonTarget):
@@ -430,18 +522,28 @@ def init_direct_control_routes(
         handler = ws_handler
         targets = _resolve_targets(handler, req)
 
-        triggered: list[str] = []
-        for uid in targets:
+        async def _respond_one(uid: str) -> bool:
             websocket = handler.client_connections.get(uid)
             if not websocket:
-                continue
+                return False
             # Ensure agent memory is synced with current history before LLM turn
             context = handler.client_contexts.get(uid)
             _sync_memory(context)
             data = {"type": "text-input", "text": req.text}
             await handler._handle_conversation_trigger(websocket, uid, data)
-            triggered.append(uid)
+            return True
 
+        results = await asyncio.gather(
+            *(_respond_one(uid) for uid in targets), return_exceptions=True
+        )
+        triggered, failed = _collect_delivered(targets, results, "respond")
+
+        if failed:
+            return RespondResponse(
+                status="partial",
+                targets=triggered,
+                message=f"Agent response failed for: {', '.join(failed)}",
+            )
         return RespondResponse(status="ok", targets=triggered, message="Agent response triggered")
 
     return router
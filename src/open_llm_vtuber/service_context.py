@@ -72,6 +72,9 @@ class ServiceContext:
         self.send_text: Callable = None
         self.client_uid: str = None
 
+        # (character_config, {"name", "avatar"}) used for DisplayText
+        self._display_base: tuple[CharacterConfig, dict] | None = None
+
     def __str__(self):
         return (
             f"ServiceContext:\n"
@@ -90,6 +93,28 @@ class ServiceContext:
             f"  MCP Enabled: {'Yes' if self.mcp_client else 'No'}"
         )
 
+    def get_display_base(self) -> dict:
+        """
+        Get the name and avatar shown alongside this character's speech.
+
+        The result is cached until character_config is replaced.
+
+        Returns:
+            dict: Keyword arguments for DisplayText besides `text`.
+        """
+        if (
+            self._display_base is None
+            or self._display_base[0] is not self.character_config
+        ):
+            self._display_base = (
+                self.character_config,
+                {
+                    "name": self.character_config.character_name,
+                    "avatar": self.character_config.avatar,
+                },
+            )
+        return self._display_base[1]
+
     # ==== Initializers
 
     async def _init_mcp_components(self, use_mcpp, enabled_servers):
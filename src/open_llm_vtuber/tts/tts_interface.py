@@ -1,9 +1,24 @@
 import abc
 import os
+import time
 import asyncio
+import itertools
 
 from loguru import logger
 
+# Process-wide sequence that keeps generated cache file names unique
+_cache_file_seq = itertools.count()
+
+
+def new_cache_file_name_no_ext() -> str:
+    """
+    Generate a unique name for a TTS cache file, without extension.
+
+    Returns:
+    str: the file name, e.g. `tts_1718000000000000000_42`
+    """
+    return f"tts_{time.time_ns()}_{next(_cache_file_seq)}"
+
 
 class TTSInterface(metaclass=abc.ABCMeta):
     async def async_generate_audio(self, text: str, file_name_no_ext=None) -> str:
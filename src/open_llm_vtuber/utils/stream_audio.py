@@ -1,34 +1,124 @@
-import base64
+import math
+import struct
+import numpy as np
+import pybase64
+import soundfile as sf
 from pydub import AudioSegment
-from pydub.utils import make_chunks
 from ..agent.output_types import Actions
 from ..agent.output_types import DisplayText
 
 
-def _get_volume_by_chunks(audio: AudioSegment, chunk_length_ms: int) -> list:
+def _get_volume_by_chunks(
+    samples: np.ndarray, sample_rate: int, chunk_length_ms: int
+) -> list:
     """
     Calculate the normalized volume (RMS) for each chunk of the audio.
 
     Parameters:
-        audio (AudioSegment): The audio segment to process.
+        samples (np.ndarray): The int16 samples, shaped (frames,) or
+            (frames, channels).
+        sample_rate (int): The sample rate of the audio.
         chunk_length_ms (int): The length of each audio chunk in milliseconds.
 
     Returns:
         list: Normalized volumes for each chunk.
     """
-    chunks = make_chunks(audio, chunk_length_ms)
-    volumes = [chunk.rms for chunk in chunks]
-    max_volume = max(volumes)
+    if samples.size == 0:
+        raise ValueError("Audio is empty or all zero.")
+
+    frames_per_chunk = max(1, sample_rate * chunk_length_ms // 1000)
+    n_full = len(samples) // frames_per_chunk
+    split = n_full * frames_per_chunk
+
+    # pydub measures length in whole milliseconds, so a leftover shorter than
+    # about half a millisecond rounds away and gets no chunk of its own
+    duration_ms = round(len(samples) * 1000 / sample_rate)
+    n_chunks = math.ceil(duration_ms / chunk_length_ms)
+
+    volumes = np.empty(0)
+    if n_full > 0:
+        full = samples[:split].reshape(n_full, -1).astype(np.int32)
+        volumes = np.sqrt((full * full).mean(axis=1))
+    if n_chunks > n_full and split < len(samples):
+        # Keep the trailing partial chunk, as make_chunks used to
+        tail = samples[split:].astype(np.int32)
+        volumes = np.append(volumes, np.sqrt((tail * tail).mean()))
+
+    max_volume = volumes.max() if volumes.size else 0
     if max_volume == 0:
         raise ValueError("Audio is empty or all zero.")
-    return [volume / max_volume for volume in volumes]
+    return (volumes / max_volume).tolist()
+
+
+def _load_audio(audio_path: str) -> tuple[np.ndarray, int]:
+    """
+    Decode an audio file into 16-bit PCM samples.
+
+    soundfile (libsndfile) is used for every format it can read. Formats it
+    cannot decode are handed to pydub and converted in memory.
+
+    Parameters:
+        audio_path (str): The path to the audio file to decode.
+
+    Returns:
+        tuple[np.ndarray, int]: The int16 samples, shaped (frames,) for mono
+            or (frames, channels) otherwise, and the sample rate.
+    """
+    try:
+        return sf.read(audio_path, dtype="int16")
+    except RuntimeError:
+        audio = AudioSegment.from_file(audio_path).set_sample_width(2)
+        samples = np.frombuffer(audio.raw_data, dtype=np.int16)
+        if audio.channels > 1:
+            samples = samples.reshape(-1, audio.channels)
+        return samples, audio.frame_rate
+
+
+def _to_wav_bytes(samples: np.ndarray, sample_rate: int) -> bytearray:
+    """
+    Wrap 16-bit PCM samples in a canonical 44-byte WAV header.
+
+    Parameters:
+        samples (np.ndarray): The int16 samples, shaped (frames,) or
+            (frames, channels).
+        sample_rate (int): The sample rate of the audio.
+
+    Returns:
+        bytearray: The complete WAV file.
+    """
+    channels = 1 if samples.ndim == 1 else samples.shape[1]
+    sample_width = 2
+    data_size = samples.size * sample_width
+
+    wav = bytearray(44 + data_size)
+    struct.pack_into(
+        "<4sI4s4sIHHIIHH4sI",
+        wav,
+        0,
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        channels,
+        sample_rate,
+        sample_rate * channels * sample_width,
+        channels * sample_width,
+        sample_width * 8,
+        b"data",
+        data_size,
+    )
+    # Copy the interleaved samples straight into the buffer after the header
+    np.frombuffer(wav, dtype="<i2", offset=44)[:] = samples.reshape(-1)
+    return wav
 
 
 def prepare_audio_payload(
     audio_path: str | None,
     chunk_length_ms: int = 20,
-    display_text: DisplayText = None,
-    actions: Actions = None,
+    display_text: DisplayText | dict = None,
+    actions: Actions | dict = None,
     forwarded: bool = False,
 ) -> dict[str, any]:
     """
@@ -38,14 +128,16 @@ def prepare_audio_payload(
     Parameters:
         audio_path (str | None): The path to the audio file to be processed, or None for silent display
         chunk_length_ms (int): The length of each audio chunk in milliseconds
-        display_text (DisplayText, optional): Text to be displayed with the audio
-        actions (Actions, optional): Actions associated with the audio
+        display_text (DisplayText | dict, optional): Text to be displayed with the audio, or its to_dict() form
+        actions (Actions | dict, optional): Actions associated with the audio, or its to_dict() form
 
     Returns:
         dict: The audio payload to be sent
     """
     if isinstance(display_text, DisplayText):
         display_text = display_text.to_dict()
+    if isinstance(actions, Actions):
+        actions = actions.to_dict()
 
     if not audio_path:
         # Return payload for silent display
@@ -55,19 +147,20 @@ def prepare_audio_payload(
             "volumes": [],
             "slice_length": chunk_length_ms,
             "display_text": display_text,
-            "actions": actions.to_dict() if actions else None,
+            "actions": actions,
             "forwarded": forwarded,
         }
 
     try:
-        audio = AudioSegment.from_file(audio_path)
-        audio_bytes = audio.export(format="wav").read()
+        samples, sample_rate = _load_audio(audio_path)
+        audio_bytes = _to_wav_bytes(samples, sample_rate)
     except Exception as e:
         raise ValueError(
             f"Error loading or converting generated audio file to wav file '{audio_path}': {e}"
         )
-    audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
-    volumes = _get_volume_by_chunks(audio, chunk_length_ms)
+    # base64 output is pure ASCII
+    audio_base64 = pybase64.b64encode(audio_bytes).decode("ascii")
+    volumes = _get_volume_by_chunks(samples, sample_rate, chunk_length_ms)
 
     payload = {
         "type": "audio",
@@ -75,7 +168,7 @@ def prepare_audio_payload(
         "volumes": volumes,
         "slice_length": chunk_length_ms,
         "display_text": display_text,
-        "actions": actions.to_dict() if actions else None,
+        "actions": actions,
         "forwarded": forwarded,
     }
 